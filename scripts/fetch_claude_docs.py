@@ -4,18 +4,33 @@ Improved Claude Code documentation fetcher with better robustness.
 """
 
 import requests
-import time
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple, Set, Optional
+from types import MappingProxyType
+from typing import Iterator, List, Tuple, Set, Optional, NamedTuple
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 import sys
 from urllib.parse import urlparse
 import json
 import hashlib
 import os
-import re
 import random
+import re
+
+try:
+    import orjson  # optional: faster manifest serialization
+except ImportError:
+    orjson = None
+
+try:
+    from blake3 import blake3 as new_hasher  # optional: faster content hashing
+    HASH_ALGO = "blake3"
+except ImportError:
+    new_hasher = hashlib.sha256
+    HASH_ALGO = "sha256"
 
 # Configure logging
 logging.basicConfig(
@@ -37,17 +52,23 @@ LLMS_TXT_URLS = {
 }
 
 # Pages under "BUILD WITH CLAUDE CODE" category
-BUILD_WITH_CLAUDE_CODE_PAGES = {
+BUILD_WITH_CLAUDE_CODE_PAGES = frozenset({
     "sub-agents", "plugins", "discover-plugins", "plugin-marketplaces",
     "skills", "output-styles", "hooks-guide", "headless", "mcp",
     "troubleshooting", "devcontainer"
-}
+})
 
 # Pages under "REFERENCE" category
-REFERENCE_PAGES = {
+REFERENCE_PAGES = frozenset({
     "cli-reference", "interactive-mode", "slash-commands", "checkpointing",
     "hooks", "plugins-reference"
-}
+})
+
+# Page name -> category ("bwc" or "ref"), for a single lookup per discovered page
+PAGE_CATEGORY = MappingProxyType({
+    **{page: "bwc" for page in BUILD_WITH_CLAUDE_CODE_PAGES},
+    **{page: "ref" for page in REFERENCE_PAGES},
+})
 
 # URL path prefixes to exclude from platform docs fetching
 # These are language-specific SDK docs that we don't need to mirror
@@ -60,6 +81,26 @@ EXCLUDED_PLATFORM_PATH_PREFIXES = (
 
 MANIFEST_FILE = "docs_manifest.json"
 
+# Hash algorithm assumed for manifest entries written before "hash_algo" was recorded
+LEGACY_HASH_ALGO = "sha256"
+
+# llms.txt link pattern for both sources, matched against the raw (undecoded) body
+# Match: [Title](https://code.claude.com/docs/en/page-name.md)
+#        [Title](https://platform.claude.com/docs/en/path.md)
+LINK_RE = re.compile(
+    rb'\[.*?\]\((?P<url>https://(?P<host>code|platform)\.claude\.com/docs/en/(?P<path>[^)]+\.md))\)'
+)
+
+# GitHub repository (owner/repo) and branch/ref name formats
+REPO_RE = re.compile(r'^[\w.-]+/[\w.-]+$')
+REF_RE = re.compile(r'^[\w.-]+$')
+
+# Markdown elements: headers, code blocks, lists, links, bold, italic, quotes
+# (bytes patterns: validation runs on the raw response body)
+MD_INDICATOR_RE = re.compile(rb'# |```|[-*] |1\. |\[|\*\*|_|> ')
+# Words expected somewhere in a documentation page
+DOC_PATTERNS_RE = re.compile(rb'installation|usage|example|api|configuration|claude|code', re.IGNORECASE)
+
 # Note: Sitemap-based discovery has been removed in v2.0.0
 # All discovery now uses llms.txt from code.claude.com and platform.claude.com
 
@@ -71,11 +112,69 @@ HEADERS = {
     'Expires': '0'
 }
 
-# Retry configuration
+# Retry configuration (handled by urllib3 inside the session's adapter)
 MAX_RETRIES = 3
-RETRY_DELAY = 2  # initial delay in seconds
-MAX_RETRY_DELAY = 30  # maximum delay in seconds
-RATE_LIMIT_DELAY = 0.5  # seconds between requests
+RETRY_BACKOFF_FACTOR = 2  # first retry waits this many seconds, doubling after: 2s, 4s, 8s
+RETRY_BACKOFF_MAX = 30  # maximum delay in seconds
+RETRY_BACKOFF_JITTER = 1.0  # random extra delay (up to this many seconds) against thundering herd
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Concurrency configuration
+MAX_CONCURRENT_REQUESTS = 8  # parallel downloads (bounds load on the doc hosts)
+CLEANUP_WORKERS = 8  # parallel unlinks of obsolete files
+
+# Connection pool configuration
+POOL_CONNECTIONS = 4  # distinct hosts we talk to
+POOL_MAXSIZE = 32  # keep-alive connections per host (>= MAX_CONCURRENT_REQUESTS)
+
+
+class FetchResult(NamedTuple):
+    """Outcome of fetching a single document."""
+    filename: str
+    content: Optional[bytes]  # None when unchanged since the last fetch (304 or same hash)
+    content_hash: Optional[str]  # HASH_ALGO digest of the fetched body; None for a 304
+    etag: Optional[str]
+    last_modified: Optional[str]
+    size: Optional[int]  # bytes downloaded; None for a 304 with no body
+
+
+class FirstBackoffRetry(Retry):
+    """
+    Retry policy that also backs off before the first retry.
+    urllib3 2.x retries the first failure immediately and without jitter; here it
+    waits backoff_factor (plus jitter) too, so concurrent workers do not hit the host in step.
+    """
+
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        if backoff == 0 and self.history and self.history[-1].redirect_location is None:
+            backoff = min(self.backoff_max, self.backoff_factor + random.random() * self.backoff_jitter)
+        return backoff
+
+
+def create_session() -> requests.Session:
+    """
+    Create a session with pooled keep-alive connections and automatic retries.
+    Retries honor Retry-After on 429/5xx responses.
+    """
+    session = requests.Session()
+    session.headers.update(HEADERS)
+
+    retry = FirstBackoffRetry(
+        total=MAX_RETRIES,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        backoff_max=RETRY_BACKOFF_MAX,
+        backoff_jitter=RETRY_BACKOFF_JITTER,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset(['GET']),
+        respect_retry_after_header=True
+    )
+    # requests speaks HTTP/1.1 only; instead of HTTP/2 multiplexing, each worker
+    # thread reuses its own keep-alive connection per host, so TLS setup is paid
+    # at most MAX_CONCURRENT_REQUESTS times per host rather than once per page.
+    adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, max_retries=retry)
+    session.mount('https://', adapter)
+    return session
 
 
 def load_manifest(docs_dir: Path) -> dict:
@@ -89,34 +188,45 @@ def load_manifest(docs_dir: Path) -> dict:
                 manifest["files"] = {}
             return manifest
         except Exception as e:
-            logger.warning(f"Failed to load manifest: {e}")
+            logger.warning("Failed to load manifest: %s", e)
     return {"files": {}, "last_updated": None}
 
 
+def dump_json(data: dict) -> bytes:
+    """Serialize data as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
 def save_manifest(docs_dir: Path, manifest: dict) -> None:
     """Save the manifest of fetched files."""
     manifest_path = docs_dir / MANIFEST_FILE
-    manifest["last_updated"] = datetime.now().isoformat()
+    manifest["last_updated"] = datetime.now(timezone.utc).isoformat()
     
     # Get GitHub repository from environment or use default
     github_repo = os.environ.get('GITHUB_REPOSITORY', 'kreitter/claude-docs')
     github_ref = os.environ.get('GITHUB_REF_NAME', 'main')
 
     # Validate repository name format (owner/repo)
-    if not re.match(r'^[\w.-]+/[\w.-]+$', github_repo):
-        logger.warning(f"Invalid repository format: {github_repo}, using default")
+    if not REPO_RE.match(github_repo):
+        logger.warning("Invalid repository format: %s, using default", github_repo)
         github_repo = 'kreitter/claude-docs'
     
     # Validate branch/ref name
-    if not re.match(r'^[\w.-]+$', github_ref):
-        logger.warning(f"Invalid ref format: {github_ref}, using default")
+    if not REF_RE.match(github_ref):
+        logger.warning("Invalid ref format: %s, using default", github_ref)
         github_ref = 'main'
     
     manifest["base_url"] = f"https://raw.githubusercontent.com/{github_repo}/{github_ref}/docs/"
     manifest["github_repository"] = github_repo
     manifest["github_ref"] = github_ref
     manifest["description"] = "Claude Code documentation manifest. Keys are filenames, append to base_url for full URL."
-    manifest_path.write_text(json.dumps(manifest, indent=2))
+
+    # Write to a temp file and swap it in so a crash never leaves a truncated manifest
+    tmp_path = manifest_path.with_suffix('.json.tmp')
+    tmp_path.write_bytes(dump_json(manifest))
+    os.replace(tmp_path, manifest_path)
 
 
 def url_to_safe_filename(url_path: str, source: str, category: str = None) -> str:
@@ -157,6 +267,16 @@ def should_exclude_platform_path(path: str) -> bool:
     return path.startswith(EXCLUDED_PLATFORM_PATH_PREFIXES)
 
 
+def iter_doc_links(llms_txt: bytes, host: bytes) -> Iterator[Tuple[str, str]]:
+    """
+    Yield (full_url, path) for every link to a host's docs in an llms.txt body.
+    host is b"code" or b"platform"; path keeps its .md suffix (e.g., "api/messages.md").
+    """
+    for match in LINK_RE.finditer(llms_txt):
+        if match['host'] == host:
+            yield match['url'].decode('utf-8'), match['path'].decode('utf-8')
+
+
 def discover_claude_code_docs(session: requests.Session) -> List[Tuple[str, str, str]]:
     """
     Discover Claude Code docs from llms.txt and categorize them.
@@ -164,32 +284,27 @@ def discover_claude_code_docs(session: requests.Session) -> List[Tuple[str, str,
     Only returns pages in BUILD_WITH_CLAUDE_CODE or REFERENCE categories.
     """
     llms_url = LLMS_TXT_URLS["claude_code"]
-    logger.info(f"Discovering Claude Code docs from {llms_url}...")
+    logger.info("Discovering Claude Code docs from %s...", llms_url)
 
     try:
-        response = session.get(llms_url, headers=HEADERS, timeout=30)
+        response = session.get(llms_url, timeout=30)
         response.raise_for_status()
     except requests.exceptions.RequestException as e:
-        logger.error(f"Failed to fetch Claude Code llms.txt: {e}")
+        logger.error("Failed to fetch Claude Code llms.txt: %s", e)
         raise
 
-    # Match: [Title](https://code.claude.com/docs/en/page-name.md)
-    pattern = re.compile(r'\[.*?\]\((https://code\.claude\.com/docs/en/([^)]+))\.md\)')
-
     results = []
-    for match in pattern.finditer(response.text):
-        full_url = match.group(1) + ".md"  # Reconstruct full URL with .md
-        page_name = match.group(2)  # e.g., "hooks", "sub-agents"
-
-        if page_name in BUILD_WITH_CLAUDE_CODE_PAGES:
-            results.append((full_url, page_name, "bwc"))
-        elif page_name in REFERENCE_PAGES:
-            results.append((full_url, page_name, "ref"))
+    for full_url, path in iter_doc_links(response.content, b"code"):
+        page_name = path[:-3]  # e.g., "hooks", "sub-agents"
+
+        category = PAGE_CATEGORY.get(page_name)
+        if category:
+            results.append((full_url, page_name, category))
         else:
             # Log unknown pages so we notice when Anthropic adds new docs
-            logger.warning(f"Unknown Claude Code page not in any category: {page_name} - add to BUILD_WITH_CLAUDE_CODE_PAGES or REFERENCE_PAGES if needed")
+            logger.warning("Unknown Claude Code page not in any category: %s - add to BUILD_WITH_CLAUDE_CODE_PAGES or REFERENCE_PAGES if needed", page_name)
 
-    logger.info(f"Discovered {len(results)} Claude Code docs (BWC + Reference)")
+    logger.info("Discovered %d Claude Code docs (BWC + Reference)", len(results))
     return results
 
 
@@ -199,80 +314,109 @@ def discover_platform_docs(session: requests.Session) -> List[Tuple[str, str]]:
     Returns list of (full_url, path) tuples.
     """
     llms_url = LLMS_TXT_URLS["platform"]
-    logger.info(f"Discovering Platform docs from {llms_url}...")
+    logger.info("Discovering Platform docs from %s...", llms_url)
 
     try:
-        response = session.get(llms_url, headers=HEADERS, timeout=30)
+        response = session.get(llms_url, timeout=30)
         response.raise_for_status()
     except requests.exceptions.RequestException as e:
-        logger.error(f"Failed to fetch Platform llms.txt: {e}")
+        logger.error("Failed to fetch Platform llms.txt: %s", e)
         raise
 
-    # Match: [Title](https://platform.claude.com/docs/en/path.md)
-    pattern = re.compile(r'\[.*?\]\((https://platform\.claude\.com/docs/en/([^)]+\.md))\)')
-
     results = []
     excluded_count = 0
-    for match in pattern.finditer(response.text):
-        full_url = match.group(1)
-        path = match.group(2)  # e.g., "api/messages.md"
+    for full_url, path in iter_doc_links(response.content, b"platform"):
         if should_exclude_platform_path(path):
             excluded_count += 1
             continue
         results.append((full_url, path))
 
-    logger.info(f"Discovered {len(results)} Platform docs (excluded {excluded_count} language-specific SDK docs)")
+    logger.info("Discovered %d Platform docs (excluded %d language-specific SDK docs)", len(results), excluded_count)
     return results
 
 
-def validate_markdown_content(content: str, filename: str) -> None:
+def validate_markdown_bytes(content: bytes, filename: str) -> None:
     """
-    Validate that content is proper markdown.
+    Validate that raw (undecoded) content is proper markdown.
     Raises ValueError if validation fails.
     """
     # Check for HTML content
-    if not content or content.startswith('<!DOCTYPE') or '<html' in content[:100]:
+    if not content or content.startswith(b'<!DOCTYPE') or b'<html' in content[:100]:
         raise ValueError("Received HTML instead of markdown")
     
     # Check minimum length
     if len(content.strip()) < 50:
         raise ValueError(f"Content too short ({len(content)} bytes)")
     
-    # Check for common markdown elements
-    lines = content.split('\n')
-    markdown_indicators = [
-        '# ',      # Headers
-        '## ',
-        '### ',
-        '```',     # Code blocks
-        '- ',      # Lists
-        '* ',
-        '1. ',
-        '[',       # Links
-        '**',      # Bold
-        '_',       # Italic
-        '> ',      # Quotes
-    ]
-    
-    # Count markdown indicators
-    indicator_count = 0
-    for line in lines[:50]:  # Check first 50 lines
-        for indicator in markdown_indicators:
-            if line.strip().startswith(indicator) or indicator in line:
-                indicator_count += 1
-                break
+    # Count lines with markdown indicators in the first 50 lines
+    lines = content.split(b'\n', 50)[:50]
+    indicator_count = sum(1 for line in lines if MD_INDICATOR_RE.search(line))
     
     # Require at least some markdown formatting
     if indicator_count < 3:
         raise ValueError(f"Content doesn't appear to be markdown (only {indicator_count} markdown indicators found)")
     
     # Check for common documentation patterns
-    doc_patterns = ['installation', 'usage', 'example', 'api', 'configuration', 'claude', 'code']
-    content_lower = content.lower()
-    pattern_found = any(pattern in content_lower for pattern in doc_patterns)
+    pattern_found = DOC_PATTERNS_RE.search(content) is not None
     
     if not pattern_found:
-        logger.warning(f"Content for {filename} doesn't contain expected documentation patterns")
+        logger.warning("Content for %s doesn't contain expected documentation patterns", filename)
+
+
+def get_cached_entry(docs_dir: Path, manifest: dict, filename: str) -> Optional[dict]:
+    """
+    Return the previous manifest entry for a file that is still on disk.
+    Conditional requests are only safe when the cached copy exists.
+    """
+    entry = manifest.get("files", {}).get(filename)
+    if entry and (docs_dir / filename).exists():
+        return entry
+    return None
+
+
+def conditional_get(session: requests.Session, url: str, previous_entry: Optional[dict]) -> requests.Response:
+    """
+    GET a URL, revalidating with the ETag/Last-Modified stored in previous_entry.
+    The caller must check for a 304 Not Modified response.
+    """
+    headers = {}
+    if previous_entry:
+        if previous_entry.get("etag"):
+            headers['If-None-Match'] = previous_entry["etag"]
+        if previous_entry.get("last_modified"):
+            headers['If-Modified-Since'] = previous_entry["last_modified"]
+
+    response = session.get(url, headers=headers, timeout=30, allow_redirects=True)
+    response.raise_for_status()
+    return response
+
+
+def matches_file(file_path: Path, content: bytes) -> bool:
+    """
+    Check whether a file on disk holds exactly content.
+    Compares sizes first so most changed files are detected without reading them.
+    """
+    try:
+        return file_path.stat().st_size == len(content) and file_path.read_bytes() == content
+    except FileNotFoundError:
+        return False
+
+
+def hash_matches(entry: dict, content_hash: str) -> bool:
+    """Check a digest against a manifest entry; an entry hashed with another algorithm never matches."""
+    return entry.get("hash_algo", LEGACY_HASH_ALGO) == HASH_ALGO and entry.get("hash") == content_hash
+
+
+def not_modified_result(filename: str, response: requests.Response, previous_entry: dict) -> FetchResult:
+    """Build the result for a 304 response, keeping the previous validators as fallback."""
+    return FetchResult(
+        filename,
+        None,
+        None,
+        response.headers.get('ETag', previous_entry.get("etag")),
+        response.headers.get('Last-Modified', previous_entry.get("last_modified")),
+        None
+    )
 
 
 def fetch_markdown_content(
@@ -280,8 +424,10 @@ def fetch_markdown_content(
     session: requests.Session,
     source: str,
     category: str = None,
-    page_path: str = None
-) -> Tuple[str, str]:
+    page_path: str = None,
+    previous_entry: Optional[dict] = None,
+    docs_dir: Optional[Path] = None
+) -> FetchResult:
     """
     Fetch markdown content with better error handling and validation.
 
@@ -291,80 +437,67 @@ def fetch_markdown_content(
         source: "code" or "platform"
         category: For code.claude.com: "bwc" or "ref"
         page_path: The path portion for filename generation (e.g., "hooks", "api/messages.md")
+        previous_entry: Manifest entry from the last fetch, used for a conditional GET
+        docs_dir: Directory holding the previously fetched copy; identical content
+                  is reported as unchanged without being hashed or validated
     """
     filename = url_to_safe_filename(page_path, source, category)
 
-    logger.info(f"Fetching: {markdown_url} -> {filename}")
-
-    for attempt in range(MAX_RETRIES):
-        try:
-            response = session.get(markdown_url, headers=HEADERS, timeout=30, allow_redirects=True)
-
-            # Handle specific HTTP errors
-            if response.status_code == 429:  # Rate limited
-                wait_time = int(response.headers.get('Retry-After', 60))
-                logger.warning(f"Rate limited. Waiting {wait_time} seconds...")
-                time.sleep(wait_time)
-                continue
-
-            response.raise_for_status()
-
-            # Get content and validate
-            content = response.text
-            validate_markdown_content(content, filename)
+    try:
+        response = conditional_get(session, markdown_url, previous_entry)
+    except requests.exceptions.RetryError as e:
+        raise Exception(f"Failed to fetch {filename} after {MAX_RETRIES} retries: {e}")
+    except requests.exceptions.RequestException as e:
+        raise Exception(f"Failed to fetch {filename}: {e}")
 
-            logger.info(f"Successfully fetched and validated {filename} ({len(content)} bytes)")
-            return filename, content
+    if response.status_code == 304:
+        return not_modified_result(filename, response, previous_entry)
 
-        except requests.exceptions.RequestException as e:
-            logger.warning(f"Attempt {attempt + 1}/{MAX_RETRIES} failed for {filename}: {e}")
-            if attempt < MAX_RETRIES - 1:
-                # Exponential backoff with jitter
-                delay = min(RETRY_DELAY * (2 ** attempt), MAX_RETRY_DELAY)
-                # Add jitter to prevent thundering herd
-                jittered_delay = delay * random.uniform(0.5, 1.0)
-                logger.info(f"Retrying in {jittered_delay:.1f} seconds...")
-                time.sleep(jittered_delay)
-            else:
-                raise Exception(f"Failed to fetch {filename} after {MAX_RETRIES} attempts: {e}")
+    content = response.content
+    etag, last_modified = response.headers.get('ETag'), response.headers.get('Last-Modified')
 
-        except ValueError as e:
-            logger.error(f"Content validation failed for {filename}: {e}")
-            raise
+    # Identical to the copy on disk: already validated on a previous run, but hashed so
+    # the manifest entry always matches the file
+    if previous_entry and docs_dir and matches_file(docs_dir / filename, content):
+        return FetchResult(filename, None, new_hasher(content).hexdigest(), etag, last_modified, len(content))
 
+    # Validate new or changed content
+    try:
+        validate_markdown_bytes(content, filename)
+    except ValueError as e:
+        logger.error("Content validation failed for %s: %s", filename, e)
+        raise
 
-def content_has_changed(content: str, old_hash: str) -> bool:
-    """Check if content has changed based on hash."""
-    new_hash = hashlib.sha256(content.encode('utf-8')).hexdigest()
-    return new_hash != old_hash
+    return FetchResult(filename, content, new_hasher(content).hexdigest(), etag, last_modified, len(content))
 
 
-def fetch_changelog(session: requests.Session) -> Tuple[str, str]:
+def fetch_changelog(
+    session: requests.Session,
+    previous_entry: Optional[dict] = None,
+    docs_dir: Optional[Path] = None
+) -> FetchResult:
     """
     Fetch Claude Code changelog from GitHub repository.
-    Returns tuple of (filename, content).
+    Returns a FetchResult whose content is None if unchanged since previous_entry
+    (304 response, or identical to the copy in docs_dir).
     """
     changelog_url = "https://raw.githubusercontent.com/anthropics/claude-code/main/CHANGELOG.md"
     filename = "changelog.md"
     
-    logger.info(f"Fetching Claude Code changelog: {changelog_url}")
-    
-    for attempt in range(MAX_RETRIES):
-        try:
-            response = session.get(changelog_url, headers=HEADERS, timeout=30, allow_redirects=True)
-            
-            if response.status_code == 429:  # Rate limited
-                wait_time = int(response.headers.get('Retry-After', 60))
-                logger.warning(f"Rate limited. Waiting {wait_time} seconds...")
-                time.sleep(wait_time)
-                continue
-            
-            response.raise_for_status()
-            
-            content = response.text
-            
-            # Add header to indicate this is from Claude Code repo, not docs site
-            header = """# Claude Code Changelog
+    logger.info("Fetching Claude Code changelog: %s", changelog_url)
+
+    try:
+        response = conditional_get(session, changelog_url, previous_entry)
+    except requests.exceptions.RetryError as e:
+        raise Exception(f"Failed to fetch changelog after {MAX_RETRIES} retries: {e}")
+    except requests.exceptions.RequestException as e:
+        raise Exception(f"Failed to fetch changelog: {e}")
+
+    if response.status_code == 304:
+        return not_modified_result(filename, response, previous_entry)
+
+    # Add header to indicate this is from Claude Code repo, not docs site
+    header = b"""# Claude Code Changelog
 
 > **Source**: https://github.com/anthropics/claude-code/blob/main/CHANGELOG.md
 > 
@@ -373,75 +506,113 @@ def fetch_changelog(session: requests.Session) -> Tuple[str, str]:
 ---
 
 """
-            content = header + content
-            
-            # Basic validation
-            if len(content.strip()) < 100:
-                raise ValueError(f"Changelog content too short ({len(content)} bytes)")
-            
-            logger.info(f"Successfully fetched changelog ({len(content)} bytes)")
-            return filename, content
-            
-        except requests.exceptions.RequestException as e:
-            logger.warning(f"Attempt {attempt + 1}/{MAX_RETRIES} failed for changelog: {e}")
-            if attempt < MAX_RETRIES - 1:
-                delay = min(RETRY_DELAY * (2 ** attempt), MAX_RETRY_DELAY)
-                jittered_delay = delay * random.uniform(0.5, 1.0)
-                logger.info(f"Retrying in {jittered_delay:.1f} seconds...")
-                time.sleep(jittered_delay)
-            else:
-                raise Exception(f"Failed to fetch changelog after {MAX_RETRIES} attempts: {e}")
-        
-        except ValueError as e:
-            logger.error(f"Changelog validation failed: {e}")
-            raise
-
-
-def save_markdown_file(docs_dir: Path, filename: str, content: str) -> str:
-    """Save markdown content and return its hash."""
+    content = header + response.content
+    etag, last_modified = response.headers.get('ETag'), response.headers.get('Last-Modified')
+
+    if previous_entry and docs_dir and matches_file(docs_dir / filename, content):
+        return FetchResult(filename, None, new_hasher(content).hexdigest(), etag, last_modified, len(content))
+
+    # Basic validation
+    if len(content.strip()) < 100:
+        logger.error("Changelog validation failed: content too short (%d bytes)", len(content))
+        raise ValueError(f"Changelog content too short ({len(content)} bytes)")
+
+    return FetchResult(filename, content, new_hasher(content).hexdigest(), etag, last_modified, len(content))
+
+
+def record_document(docs_dir: Path, manifest: dict, result: FetchResult, now_iso: str) -> dict:
+    """
+    Save fetched content if it differs from the previous fetch or the copy on disk is missing.
+    Returns the hash, timestamp and cache validator fields for the new manifest entry;
+    now_iso is the run's timestamp, used for updated (or previously untracked) files.
+    """
+    filename = result.filename
+    old_entry = manifest.get("files", {}).get(filename, {})
+
+    if result.content is not None and not hash_matches(old_entry, result.content_hash):
+        save_markdown_file(docs_dir, filename, result.content)
+        content_hash, hash_algo = result.content_hash, HASH_ALGO
+        status = "updated"
+        last_updated = now_iso
+    else:
+        if result.content is not None:
+            # Same content as recorded, but the copy on disk is missing or was edited locally
+            save_markdown_file(docs_dir, filename, result.content)
+            status = "restored"
+        else:
+            status = "unchanged"
+        if result.content_hash is None or hash_matches(old_entry, result.content_hash):
+            content_hash = old_entry.get("hash", "")
+            hash_algo = old_entry.get("hash_algo", LEGACY_HASH_ALGO)
+        else:
+            # The file on disk matches the fetched body but the recorded hash does not
+            # (e.g. a run interrupted before saving the manifest): record the real hash
+            content_hash, hash_algo = result.content_hash, HASH_ALGO
+        last_updated = old_entry.get("last_updated", now_iso)
+
+    size = result.size if result.size is not None else "-"
+    logger.info("doc=%s status=%s bytes=%s", filename, status, size)
+
+    fields = {"hash": content_hash, "hash_algo": hash_algo, "last_updated": last_updated}
+    if result.etag:
+        fields["etag"] = result.etag
+    if result.last_modified:
+        fields["last_modified"] = result.last_modified
+    return fields
+
+
+def save_markdown_file(docs_dir: Path, filename: str, content: bytes) -> None:
+    """Save markdown content exactly as fetched."""
     file_path = docs_dir / filename
     
     try:
-        file_path.write_text(content, encoding='utf-8')
-        content_hash = hashlib.sha256(content.encode('utf-8')).hexdigest()
-        logger.info(f"Saved: {filename}")
-        return content_hash
+        file_path.write_bytes(content)
     except Exception as e:
-        logger.error(f"Failed to save {filename}: {e}")
+        logger.error("Failed to save %s: %s", filename, e)
         raise
 
 
+def remove_file(file_path: Path) -> bool:
+    """Delete a file, returning False if it was already gone."""
+    try:
+        file_path.unlink()
+        return True
+    except FileNotFoundError:
+        return False
+
+
 def cleanup_old_files(docs_dir: Path, current_files: Set[str], manifest: dict) -> None:
     """
     Remove only files that were previously fetched but no longer exist.
     Preserves manually added files.
     """
     previous_files = set(manifest.get("files", {}).keys())
-    files_to_remove = previous_files - current_files
-    
-    for filename in files_to_remove:
-        if filename == MANIFEST_FILE:  # Never delete the manifest
-            continue
-            
-        file_path = docs_dir / filename
-        if file_path.exists():
-            logger.info(f"Removing obsolete file: {filename}")
-            file_path.unlink()
+    files_to_remove = sorted(previous_files - current_files - {MANIFEST_FILE})  # Never delete the manifest
+    if not files_to_remove:
+        return
+
+    # Unlinks are independent syscalls, so issue them in parallel
+    with ThreadPoolExecutor(max_workers=CLEANUP_WORKERS) as executor:
+        removed = executor.map(remove_file, (docs_dir / filename for filename in files_to_remove))
+        for filename, was_removed in zip(files_to_remove, removed):
+            if was_removed:
+                logger.info("Removed obsolete file: %s", filename)
 
 
 def main():
     """Main function with dual-source documentation fetching."""
-    start_time = datetime.now()
+    start_time = datetime.now(timezone.utc)
+    now_iso = start_time.isoformat()  # timestamp for every file updated in this run
     logger.info("Starting Claude documentation fetch v2.0.0")
 
     # Log configuration
     github_repo = os.environ.get('GITHUB_REPOSITORY', 'kreitter/claude-docs')
-    logger.info(f"GitHub repository: {github_repo}")
+    logger.info("GitHub repository: %s", github_repo)
 
     # Create docs directory at repository root
     docs_dir = Path(__file__).parent.parent / 'docs'
     docs_dir.mkdir(exist_ok=True)
-    logger.info(f"Output directory: {docs_dir}")
+    logger.info("Output directory: %s", docs_dir)
 
     # Load manifest
     manifest = load_manifest(docs_dir)
@@ -455,153 +626,101 @@ def main():
     discovery_methods = []
     total_discovered = 0
 
-    with requests.Session() as session:
+    with create_session() as session, ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+        # Both discovery requests and the changelog fetch are independent, so
+        # start all three at once; doc downloads are queued as each discovery
+        # completes and share the same worker pool.
+        code_discovery = executor.submit(discover_claude_code_docs, session)
+        platform_discovery = executor.submit(discover_platform_docs, session)
+        changelog_future = executor.submit(
+            fetch_changelog, session, get_cached_entry(docs_dir, manifest, "changelog.md"), docs_dir
+        )
+
+        # Documents being fetched: (label, full_url, source, category, future)
+        jobs = []
+
         # ============================================================
         # Source 1: Claude Code docs (code.claude.com)
         # Only BWC (Build with Claude Code) and Reference categories
         # ============================================================
         try:
-            claude_code_docs = discover_claude_code_docs(session)
+            claude_code_docs = code_discovery.result()
             discovery_methods.append(f"code.claude.com({len(claude_code_docs)} pages)")
             total_discovered += len(claude_code_docs)
 
-            for i, (full_url, page_name, category) in enumerate(claude_code_docs, 1):
-                logger.info(f"[Claude Code {i}/{len(claude_code_docs)}] {page_name} ({category})")
-
-                try:
-                    filename, content = fetch_markdown_content(
-                        markdown_url=full_url,
-                        session=session,
-                        source="code",
-                        category=category,
-                        page_path=page_name
-                    )
-
-                    # Check if content has changed
-                    old_hash = manifest.get("files", {}).get(filename, {}).get("hash", "")
-                    old_entry = manifest.get("files", {}).get(filename, {})
-
-                    if content_has_changed(content, old_hash):
-                        content_hash = save_markdown_file(docs_dir, filename, content)
-                        logger.info(f"Updated: {filename}")
-                        last_updated = datetime.now().isoformat()
-                    else:
-                        content_hash = old_hash
-                        logger.info(f"Unchanged: {filename}")
-                        last_updated = old_entry.get("last_updated", datetime.now().isoformat())
-
-                    new_manifest["files"][filename] = {
-                        "original_url": full_url[:-3],  # Remove .md for display URL
-                        "original_md_url": full_url,
-                        "hash": content_hash,
-                        "last_updated": last_updated,
-                        "source": "code.claude.com",
-                        "category": category
-                    }
-
-                    fetched_files.add(filename)
-                    successful += 1
-
-                    # Rate limiting
-                    time.sleep(RATE_LIMIT_DELAY)
-
-                except Exception as e:
-                    logger.error(f"Failed to process {page_name}: {e}")
-                    failed += 1
-                    failed_pages.append(f"code:{page_name}")
+            for full_url, page_name, category in claude_code_docs:
+                filename = url_to_safe_filename(page_name, "code", category)
+                future = executor.submit(
+                    fetch_markdown_content, full_url, session, "code", category, page_name,
+                    get_cached_entry(docs_dir, manifest, filename), docs_dir
+                )
+                jobs.append((f"code:{page_name}", full_url, "code", category, future))
 
         except Exception as e:
-            logger.error(f"Failed to discover Claude Code docs: {e}")
+            logger.error("Failed to discover Claude Code docs: %s", e)
 
         # ============================================================
         # Source 2: Platform docs (platform.claude.com)
         # All documentation
         # ============================================================
         try:
-            platform_docs = discover_platform_docs(session)
+            platform_docs = platform_discovery.result()
             discovery_methods.append(f"platform.claude.com({len(platform_docs)} pages)")
             total_discovered += len(platform_docs)
 
-            for i, (full_url, path) in enumerate(platform_docs, 1):
-                logger.info(f"[Platform {i}/{len(platform_docs)}] {path}")
-
-                try:
-                    filename, content = fetch_markdown_content(
-                        markdown_url=full_url,
-                        session=session,
-                        source="platform",
-                        category=None,
-                        page_path=path
-                    )
-
-                    # Check if content has changed
-                    old_hash = manifest.get("files", {}).get(filename, {}).get("hash", "")
-                    old_entry = manifest.get("files", {}).get(filename, {})
-
-                    if content_has_changed(content, old_hash):
-                        content_hash = save_markdown_file(docs_dir, filename, content)
-                        logger.info(f"Updated: {filename}")
-                        last_updated = datetime.now().isoformat()
-                    else:
-                        content_hash = old_hash
-                        logger.info(f"Unchanged: {filename}")
-                        last_updated = old_entry.get("last_updated", datetime.now().isoformat())
-
-                    new_manifest["files"][filename] = {
-                        "original_url": full_url[:-3],  # Remove .md for display URL
-                        "original_md_url": full_url,
-                        "hash": content_hash,
-                        "last_updated": last_updated,
-                        "source": "platform.claude.com"
-                    }
-
-                    fetched_files.add(filename)
-                    successful += 1
-
-                    # Rate limiting
-                    time.sleep(RATE_LIMIT_DELAY)
-
-                except Exception as e:
-                    logger.error(f"Failed to process {path}: {e}")
-                    failed += 1
-                    failed_pages.append(f"platform:{path}")
+            for full_url, path in platform_docs:
+                filename = url_to_safe_filename(path, "platform")
+                future = executor.submit(
+                    fetch_markdown_content, full_url, session, "platform", None, path,
+                    get_cached_entry(docs_dir, manifest, filename), docs_dir
+                )
+                jobs.append((f"platform:{path}", full_url, "platform", None, future))
 
         except Exception as e:
-            logger.error(f"Failed to discover Platform docs: {e}")
+            logger.error("Failed to discover Platform docs: %s", e)
+
+        # Results are consumed in discovery order so the manifest layout
+        # stays stable between runs.
+        for label, full_url, source, category, future in jobs:
+            try:
+                result = future.result()
+
+                entry = {
+                    "original_url": full_url[:-3],  # Remove .md for display URL
+                    "original_md_url": full_url,
+                    **record_document(docs_dir, manifest, result, now_iso),
+                    "source": f"{source}.claude.com"
+                }
+                if category:
+                    entry["category"] = category
+                new_manifest["files"][result.filename] = entry
+
+                fetched_files.add(result.filename)
+                successful += 1
+
+            except Exception as e:
+                logger.error("Failed to process %s: %s", label, e)
+                failed += 1
+                failed_pages.append(label)
 
         # ============================================================
         # Source 3: Claude Code changelog (GitHub)
         # ============================================================
-        logger.info("Fetching Claude Code changelog...")
         try:
-            filename, content = fetch_changelog(session)
-
-            # Check if content has changed
-            old_hash = manifest.get("files", {}).get(filename, {}).get("hash", "")
-            old_entry = manifest.get("files", {}).get(filename, {})
-
-            if content_has_changed(content, old_hash):
-                content_hash = save_markdown_file(docs_dir, filename, content)
-                logger.info(f"Updated: {filename}")
-                last_updated = datetime.now().isoformat()
-            else:
-                content_hash = old_hash
-                logger.info(f"Unchanged: {filename}")
-                last_updated = old_entry.get("last_updated", datetime.now().isoformat())
-
-            new_manifest["files"][filename] = {
+            result = changelog_future.result()
+
+            new_manifest["files"][result.filename] = {
                 "original_url": "https://github.com/anthropics/claude-code/blob/main/CHANGELOG.md",
                 "original_raw_url": "https://raw.githubusercontent.com/anthropics/claude-code/main/CHANGELOG.md",
-                "hash": content_hash,
-                "last_updated": last_updated,
+                **record_document(docs_dir, manifest, result, now_iso),
                 "source": "claude-code-repository"
             }
 
-            fetched_files.add(filename)
+            fetched_files.add(result.filename)
             successful += 1
 
         except Exception as e:
-            logger.error(f"Failed to fetch changelog: {e}")
+            logger.error("Failed to fetch changelog: %s", e)
             failed += 1
             failed_pages.append("changelog")
 
@@ -609,9 +728,11 @@ def main():
     cleanup_old_files(docs_dir, fetched_files, manifest)
 
     # Add metadata to manifest
+    end_time = datetime.now(timezone.utc)
+    duration = end_time - start_time
     new_manifest["fetch_metadata"] = {
-        "last_fetch_completed": datetime.now().isoformat(),
-        "fetch_duration_seconds": (datetime.now() - start_time).total_seconds(),
+        "last_fetch_completed": end_time.isoformat(),
+        "fetch_duration_seconds": duration.total_seconds(),
         "total_pages_discovered": total_discovered,
         "pages_fetched_successfully": successful,
         "pages_failed": failed,
@@ -629,17 +750,16 @@ def main():
     save_manifest(docs_dir, new_manifest)
 
     # Summary
-    duration = datetime.now() - start_time
     logger.info("\n" + "="*50)
-    logger.info(f"Fetch completed in {duration}")
-    logger.info(f"Discovered pages: {total_discovered}")
-    logger.info(f"Successful: {successful}/{total_discovered}")
-    logger.info(f"Failed: {failed}")
+    logger.info("Fetch completed in %s", duration)
+    logger.info("Discovered pages: %d", total_discovered)
+    logger.info("Successful: %d/%d", successful, total_discovered)
+    logger.info("Failed: %d", failed)
     
     if failed_pages:
         logger.warning("\nFailed pages (will retry next run):")
         for page in failed_pages:
-            logger.warning(f"  - {page}")
+            logger.warning("  - %s", page)
         # Don't exit with error - partial success is OK
         if successful == 0:
             logger.error("No pages were fetched successfully!")
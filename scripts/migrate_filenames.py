@@ -11,8 +11,11 @@ This script:
 
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict
+from typing import List, Set, Tuple
+
+RENAME_WORKERS = 16  # parallel rename syscalls
 
 
 def new_url_to_safe_filename(url_path: str) -> str:
@@ -60,11 +63,12 @@ def main():
     print(f"Loaded manifest with {len(manifest['files'])} files")
     print()
 
-    # Calculate renames
-    renames = []
-    new_manifest_files = {}
+    # Calculate renames; manifest entries are re-keyed once the renames have run
+    files = manifest['files']
+    renames: List[Tuple[Path, Path, str, str]] = []
+    entries: List[Tuple[str, str, dict]] = []
 
-    for old_filename, file_data in manifest['files'].items():
+    for old_filename, file_data in files.items():
         # Extract URL path from original_url
         original_url = file_data.get('original_url', '')
 
@@ -82,11 +86,10 @@ def main():
             if old_path.exists():
                 renames.append((old_path, new_path, old_filename, new_filename))
 
-        # Update manifest with new filename
-        new_manifest_files[new_filename] = file_data
+        entries.append((old_filename, new_filename, file_data))
 
     print(f"Files to rename: {len(renames)}")
-    print(f"Files unchanged: {len(manifest['files']) - len(renames)}")
+    print(f"Files unchanged: {len(files) - len(renames)}")
     print()
 
     if not renames:
@@ -114,16 +117,41 @@ def main():
     print("Renaming files...")
     success = 0
     failed = 0
-
-    for old_path, new_path, old_name, new_name in renames:
-        try:
-            old_path.rename(new_path)
-            success += 1
-            if success <= 5 or success % 10 == 0:
-                print(f"  ✓ Renamed {success}/{len(renames)}: {old_name}")
-        except Exception as e:
-            print(f"  ✗ Failed to rename {old_name}: {e}")
+    not_renamed: Set[str] = set()  # old names of skipped or failed renames
+
+    # Renames run concurrently and Path.rename silently replaces an existing target on
+    # POSIX, so skip any rename onto an existing file, another rename's source, or a
+    # target already claimed by an earlier rename
+    sources = {old_path for old_path, new_path, old_name, new_name in renames}
+    targets = set()
+    safe_renames = []
+    for rename in renames:
+        old_path, new_path, old_name, new_name = rename
+        if new_path in sources or new_path in targets or new_path.exists():
+            print(f"  ✗ Skipped {old_name}: target {new_name} is in use")
+            not_renamed.add(old_name)
             failed += 1
+        else:
+            targets.add(new_path)
+            safe_renames.append(rename)
+
+    # Remaining renames are independent syscalls, so overlap them; counts are kept in this thread
+    with ThreadPoolExecutor(max_workers=RENAME_WORKERS) as executor:
+        futures = {
+            executor.submit(old_path.rename, new_path): old_name
+            for old_path, new_path, old_name, new_name in safe_renames
+        }
+        for future in as_completed(futures):
+            old_name = futures[future]
+            try:
+                future.result()
+                success += 1
+                if success <= 5 or success % 10 == 0:
+                    print(f"  ✓ Renamed {success}/{len(safe_renames)}: {old_name}")
+            except Exception as e:
+                print(f"  ✗ Failed to rename {old_name}: {e}")
+                not_renamed.add(old_name)
+                failed += 1
 
     print()
     print(f"Renamed: {success} files")
@@ -133,7 +161,15 @@ def main():
     # Update manifest
     print()
     print("Updating manifest...")
-    manifest['files'] = new_manifest_files
+
+    # Re-key in two phases (remove every old key, then insert the new ones) so a new
+    # name that is another entry's old name cannot overwrite it; order is preserved.
+    # Entries whose rename was skipped or failed keep the name their file still has.
+    files.clear()
+    files.update(
+        (old_name if old_name in not_renamed else new_name, file_data)
+        for old_name, new_name, file_data in entries
+    )
 
     # Add migration metadata
     from datetime import datetime